@@ -4,15 +4,23 @@ CLI interface for evaluating test results and scoring vulnerabilities
 """
 
 import json
+import os
+import re
+import shutil
+import signal
 import sys
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 try:
-    from rich.console import Console
+    from rich.console import Console, Group
     from rich.panel import Panel
-    from rich.prompt import IntPrompt, Prompt
     from rich.table import Table
 
     RICH_AVAILABLE = True
@@ -21,11 +29,148 @@ except ImportError:
     print("Note: Install 'rich' for enhanced CLI experience: pip install rich")
 
 import contextlib
-import termios
-import tty
 
+try:
+    import select
+    import termios
+    import tty
+
+    TERMIOS_AVAILABLE = True
+except ImportError:
+    # Non-POSIX platform (e.g. Windows) - single-key input falls back to
+    # line-based prompts
+    TERMIOS_AVAILABLE = False
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
 
-@dataclass
+    def _json_dump_bytes(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dump_bytes(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+
+# Separator between conversation turns - built once instead of per render
+_TURN_SEPARATOR = "\n\n" + "=" * 60 + "\n\n"
+
+# Commands that exit the main evaluation loop (\x04 is Ctrl+D)
+_QUIT_COMMANDS = frozenset({"q", "quit", "exit", "end", "\x04"})
+
+# Descriptive names for conversation turns, mapped by index based on
+# common multi-turn attack patterns; later turns get generic names
+_TURN_NAMES = (
+    "Opening/Rapport Building",
+    "Topic Introduction",
+    "Escalation/Focus Shift",
+    "Direct Request/Goal",
+    "Follow-up/Clarification",
+    "Final Push",
+)
+
+# Defaults for raw result rows; category and evidence use None sentinels
+# since their fallbacks (the enclosing category key, a fresh list) are
+# filled in per row during parsing
+_RESULT_DEFAULTS: dict[str, Any] = {
+    "test_id": "",
+    "test_name": "",
+    "category": None,
+    "prompt": "",
+    "conversation_turns": None,
+    "response_content": "",
+    "vulnerability_detected": False,
+    "confidence": 0.0,
+    "evidence": None,
+    "reasoning": "",
+    "all_responses": None,
+    "response_times": None,
+    "response_errors": None,
+    "thinking": None,
+    "all_thinking": None,
+    "flagged": False,
+    "notes": None,
+    "repetition_run": None,
+    "total_repetitions": None,
+}
+
+# Shared status symbols - defined once so the rich and plain branches
+# can't drift apart
+_FLAGGED_BANNER = "🚩 FLAGGED AS FINDING"
+_FLAGGED_BANNER_RICH = "[red]🚩 FLAGGED AS FINDING[/red]"
+
+# Fallback pattern for markup tags outside the known set below
+_RICH_MARKUP_RE = re.compile(r"\[/?[^]]*\]")
+
+# Arrow-key escape sequences mapped to their display characters
+_ESC_MAP = {
+    "\x1b[C": "→",
+    "\x1b[D": "←",
+    "\x1b[A": "↑",
+    "\x1b[B": "↓",
+}
+
+# The closed set of Rich markup tags this module emits - fixed-literal
+# str.replace is a tight C loop, far cheaper than re.sub for these
+_RICH_TAGS = (
+    "[bold cyan]",
+    "[/bold cyan]",
+    "[bold green]",
+    "[/bold green]",
+    "[bold]",
+    "[/bold]",
+    "[red]",
+    "[/red]",
+    "[yellow]",
+    "[/yellow]",
+    "[green]",
+    "[/green]",
+    "[cyan]",
+    "[/cyan]",
+    "[dim]",
+    "[/dim]",
+)
+
+
+def _detect_clipboard_cmd() -> list[str] | None:
+    """Pick the platform clipboard command once instead of probing per copy"""
+    import platform
+
+    system = platform.system()
+    if system == "Darwin":  # macOS
+        return ["pbcopy"] if shutil.which("pbcopy") else None
+    if system == "Linux":
+        # Prefer wl-copy on Wayland sessions, then xclip, then xsel
+        if os.environ.get("WAYLAND_DISPLAY") and shutil.which("wl-copy"):
+            return ["wl-copy"]
+        if shutil.which("xclip"):
+            return ["xclip", "-selection", "clipboard"]
+        if shutil.which("xsel"):
+            return ["xsel", "--clipboard", "--input"]
+        return None
+    if system == "Windows":
+        return ["clip"]
+    return None
+
+
+def _strip_markup(text: str) -> str:
+    """Strip Rich markup for plain text display"""
+    # Cheap membership check first - most content has no markup at all
+    if "[" not in text:
+        return text
+    for tag in _RICH_TAGS:
+        text = text.replace(tag, "")
+    if "[" not in text:
+        return text
+    # Fallback for tags outside the known set (e.g. embedded in responses)
+    return _RICH_MARKUP_RE.sub("", text)
+
+
+@dataclass(slots=True)
 class TestResult:
     """Container for test result data"""
 
@@ -57,93 +202,104 @@ class TestResult:
     repetition_run: int | None = None
     total_repetitions: int | None = None
 
+    # Memoized display strings - conversation data never changes after load,
+    # so repeated navigation back to a result reuses the rendered text
+    _display_cache: dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+
+    @staticmethod
+    def _turn_name(i: int) -> str:
+        """Get the descriptive name for a single turn index (0-based)"""
+        return _TURN_NAMES[i] if i < len(_TURN_NAMES) else f"Turn {i + 1}"
+
     def get_turn_names(self) -> list[str]:
         """Get descriptive names for conversation turns"""
+        cached = self._display_cache.get("turn_names")
+        if cached is not None:
+            return cached
         if not self.conversation_turns:
             return []
 
-        # Map turn indices to descriptive names based on common patterns
-        turn_names = [
-            "Opening/Rapport Building",
-            "Topic Introduction",
-            "Escalation/Focus Shift",
-            "Direct Request/Goal",
-            "Follow-up/Clarification",
-            "Final Push",
-        ]
-
-        # Return appropriate number of turn names
-        num_turns = len(self.conversation_turns)
-        if num_turns <= len(turn_names):
-            return turn_names[:num_turns]
-        else:
-            # If more turns than predefined names, add generic ones
-            result = turn_names[:]
-            for i in range(len(turn_names), num_turns):
-                result.append(f"Turn {i + 1}")
-            return result
-
-    def get_display_conversation(self) -> str:
-        """Get full conversation for display - handles both single-turn and multi-turn"""
+        names = [self._turn_name(i) for i in range(len(self.conversation_turns))]
+        self._display_cache["turn_names"] = names
+        return names
+
+    def get_display_conversation(self, plain: bool = False) -> str:
+        """Get full conversation for display - handles both single-turn and multi-turn
+
+        With plain=True the markup tags are omitted up front, so non-rich
+        terminals don't pay for tagging text and then stripping it again.
+        """
+        key = "conversation_plain" if plain else "conversation"
+        cached = self._display_cache.get(key)
+        if cached is not None:
+            return cached
+        conversation = self._build_display_conversation(plain)
+        self._display_cache[key] = conversation
+        return conversation
+
+    def _build_display_conversation(self, plain: bool = False) -> str:
+        """Build the conversation display string (uncached)"""
+        cyan, cyan_end = ("", "") if plain else ("[bold cyan]", "[/bold cyan]")
+        green, green_end = ("", "") if plain else ("[bold green]", "[/bold green]")
+
         if self.conversation_turns and self.all_responses:
             # Multi-turn: show full conversation with responses
             conversation_parts = []
-            turn_names = self.get_turn_names()
 
             for i, (turn_prompt, response) in enumerate(
                 zip(self.conversation_turns, self.all_responses, strict=False)
             ):
-                turn_name = turn_names[i] if i < len(turn_names) else f"Turn {i + 1}"
+                turn_name = self._turn_name(i)
                 response_time = (
                     self.response_times[i]
                     if self.response_times and i < len(self.response_times)
                     else 0.0
                 )
 
-                # Format each turn as a conversation with colors
-                turn_header = f"--- {turn_name} ({response_time:.1f}s) ---"
-                user_part = f"[bold cyan]USER: {turn_prompt}[/bold cyan]"
-                model_part = f"[bold green]MODEL:[/bold green] {response}"
-
-                conversation_parts.append(f"{turn_header}\n{user_part}\n\n{model_part}")
+                # Format each turn as a conversation with colors - one f-string
+                # per turn, joined once at the end to avoid repeated copies
+                conversation_parts.append(
+                    f"--- {turn_name} ({response_time:.1f}s) ---\n"
+                    f"{cyan}USER: {turn_prompt}{cyan_end}\n\n"
+                    f"{green}MODEL:{green_end} {response}"
+                )
 
-            return "\n\n" + "=" * 60 + "\n\n".join(conversation_parts)
+            return _TURN_SEPARATOR.join(conversation_parts)
 
         elif self.conversation_turns:
             # Multi-turn but no individual responses (fallback)
             turns = []
-            turn_names = self.get_turn_names()
             for i, turn in enumerate(self.conversation_turns):
-                turn_name = turn_names[i] if i < len(turn_names) else f"Turn {i + 1}"
-                turns.append(f"{turn_name}: {turn}")
-            return (
-                "\n\n".join(turns)
-                + f"\n\n[bold green]FINAL RESPONSE:[/bold green]\n{self.response}"
-            )
+                turns.append(f"{self._turn_name(i)}: {turn}")
+            return "\n\n".join(turns) + f"\n\n{green}FINAL RESPONSE:{green_end}\n{self.response}"
 
         else:
             # Single-turn: just return the prompt and response with colors
-            return f"[bold cyan]USER: {self.prompt or 'No prompt available'}[/bold cyan]\n\n[bold green]MODEL:[/bold green] {self.response}"
+            return (
+                f"{cyan}USER: {self.prompt or 'No prompt available'}{cyan_end}\n\n"
+                f"{green}MODEL:{green_end} {self.response}"
+            )
 
     def _strip_rich_markup(self, text: str) -> str:
         """Strip Rich markup for plain text display"""
-        import re
-
-        return re.sub(r"\[/?[^]]*\]", "", text)
+        return _strip_markup(text)
 
     def get_display_prompt(self) -> str:
         """Legacy method for backward compatibility"""
+        cached = self._display_cache.get("prompt")
+        if cached is not None:
+            return cached
         if self.conversation_turns:
             # Multi-turn: show all turns with labels
-            turn_names = self.get_turn_names()
             turns = []
             for i, turn in enumerate(self.conversation_turns):
-                turn_name = turn_names[i] if i < len(turn_names) else f"Turn {i + 1}"
-                turns.append(f"{turn_name}: {turn}")
-            return "\n\n".join(turns)
+                turns.append(f"{self._turn_name(i)}: {turn}")
+            prompt = "\n\n".join(turns)
         else:
             # Single-turn: just return the prompt
-            return self.prompt or "No prompt available"
+            prompt = self.prompt or "No prompt available"
+        self._display_cache["prompt"] = prompt
+        return prompt
 
     def get_raw_prompts(self) -> str:
         """Get raw prompts without any formatting for copying to clipboard"""
@@ -167,15 +323,74 @@ class CLIEvaluator:
         self.test_results: list[TestResult] = self._parse_results()
         self.current_index = 0
 
+        # Help screen and commands table are static - built lazily, reused
+        self._help_renderable: Any = None
+        self._commands_table: Any = None
+
+        # Clipboard backend resolved once - avoids spawning (and failing)
+        # probe processes on every copy command
+        self._clipboard_cmd = _detect_clipboard_cmd()
+
+        # stdin descriptor cached for the per-keystroke raw-mode toggle;
+        # None when stdin isn't a tty (falls back to line input)
+        try:
+            self._stdin_fd: int | None = sys.stdin.fileno() if sys.stdin.isatty() else None
+        except (ValueError, OSError):
+            self._stdin_fd = None
+
+        # Flagged count maintained incrementally by the f/u handlers so the
+        # status bar doesn't rescan all results on every keystroke
+        self._flagged_count = sum(1 for r in self.test_results if r.flagged)
+
+        # Terminal width queried once per session and refreshed on resize
+        # instead of per status-bar redraw
+        self._term_width = shutil.get_terminal_size((80, 24)).columns
+        with contextlib.suppress(AttributeError, ValueError, OSError):
+            signal.signal(signal.SIGWINCH, self._on_resize)
+
+        # Rendered result screens keyed by index - result content never
+        # changes during a session (flag state is printed separately), so
+        # revisiting a result reuses its render tree
+        self._render_cache: dict[int, Any] = {}
+
+        # Command dispatch table - one dict lookup per keystroke instead of
+        # walking an elif chain of string comparisons
+        self._command_handlers: dict[str, Callable[[], Any]] = {
+            "n": self._cmd_next,
+            "next": self._cmd_next,
+            "→": self._cmd_next,
+            "p": self._cmd_prev,
+            "prev": self._cmd_prev,
+            "←": self._cmd_prev,
+            "f": self._cmd_flag,
+            "u": self._cmd_unflag,
+            "j": self._cmd_jump,
+            "c": self._copy_prompt_to_clipboard,
+            "r": self._copy_response_to_clipboard,
+            "t": self._display_thinking,
+            "e": self._export_findings,
+            "v": self._view_findings,
+            "h": self._show_help,
+            "?": self._show_help,
+        }
+
         if RICH_AVAILABLE:
-            self.console = Console()
+            # highlight=False: the default ReprHighlighter regex-scans every
+            # printed string (numbers, URLs, UUIDs, ...) which is pure
+            # overhead for multi-KB model responses in a triage viewer
+            self.console = Console(highlight=False)
         else:
             self.console = None
 
+    def _on_resize(self, signum: int, frame: Any) -> None:
+        """Refresh the cached terminal width when the window is resized"""
+        self._term_width = shutil.get_terminal_size((80, 24)).columns
+
     def _load_results(self) -> dict[str, Any]:
         """Load results from JSON file"""
-        with open(self.results_file) as f:
-            return json.load(f)
+        # Read raw bytes and let the C decoder handle UTF-8 directly,
+        # instead of layering text-mode incremental decoding under json.load
+        return _json_loads(Path(self.results_file).read_bytes())
 
     def _parse_results(self) -> list[TestResult]:
         """Parse results into TestResult objects"""
@@ -183,30 +398,33 @@ class CLIEvaluator:
 
         for category, category_data in self.results_data.items():
             for test_detail in category_data.get("test_details", []):
+                # One C-level dict merge fills the defaults instead of a
+                # .get() call per field per row
+                row = {**_RESULT_DEFAULTS, **test_detail}
                 result = TestResult(
-                    test_id=test_detail.get("test_id", ""),
-                    test_name=test_detail.get("test_name", ""),
-                    category=test_detail.get("category", category),
-                    prompt=test_detail.get("prompt", ""),
-                    conversation_turns=test_detail.get("conversation_turns", None),
-                    response=test_detail.get("response_content", ""),
-                    vulnerability_detected=test_detail.get("vulnerability_detected", False),
-                    confidence=test_detail.get("confidence", 0.0),
-                    evidence=test_detail.get("evidence", []),
-                    reasoning=test_detail.get("reasoning", ""),
+                    test_id=row["test_id"],
+                    test_name=row["test_name"],
+                    category=row["category"] if row["category"] is not None else category,
+                    prompt=row["prompt"],
+                    conversation_turns=row["conversation_turns"],
+                    response=row["response_content"],
+                    vulnerability_detected=row["vulnerability_detected"],
+                    confidence=row["confidence"],
+                    evidence=row["evidence"] if row["evidence"] is not None else [],
+                    reasoning=row["reasoning"],
                     # Multi-turn conversation data
-                    all_responses=test_detail.get("all_responses", None),
-                    response_times=test_detail.get("response_times", None),
-                    response_errors=test_detail.get("response_errors", None),
+                    all_responses=row["all_responses"],
+                    response_times=row["response_times"],
+                    response_errors=row["response_errors"],
                     # Chain of thought data
-                    thinking=test_detail.get("thinking", None),
-                    all_thinking=test_detail.get("all_thinking", None),
+                    thinking=row["thinking"],
+                    all_thinking=row["all_thinking"],
                     # Load saved evaluation data
-                    flagged=test_detail.get("flagged", False),
-                    notes=test_detail.get("notes"),
+                    flagged=row["flagged"],
+                    notes=row["notes"],
                     # Load repetition metadata
-                    repetition_run=test_detail.get("repetition_run"),
-                    total_repetitions=test_detail.get("total_repetitions"),
+                    repetition_run=row["repetition_run"],
+                    total_repetitions=row["total_repetitions"],
                 )
                 test_results.append(result)
 
@@ -215,47 +433,51 @@ class CLIEvaluator:
     def _save_updated_results(self) -> None:
         """Save updated results with flagged status back to JSON file"""
         try:
+            # Index results by (test_id, repetition_run) once - one dict
+            # lookup per test_detail instead of a linear rescan of all
+            # results for every entry on each autosave
+            index: dict[tuple[str, int | None], TestResult] = {}
+            by_test_id: dict[str, TestResult] = {}
+            for result in self.test_results:
+                index.setdefault((result.test_id, result.repetition_run), result)
+                by_test_id.setdefault(result.test_id, result)
+
             # Update the original results data with flagged status
             for _category, category_data in self.results_data.items():
                 for i, test_detail in enumerate(category_data.get("test_details", [])):
-                    # Find matching test result by test_id and repetition_run (if applicable)
                     test_id = test_detail.get("test_id")
                     repetition_run = test_detail.get("repetition_run")
 
-                    for result in self.test_results:
-                        # Match by test_id and repetition_run (if both have repetition data)
-                        if result.test_id == test_id:
-                            # If both have repetition data, they must match
-                            if repetition_run is not None and result.repetition_run is not None:
-                                if repetition_run == result.repetition_run:
-                                    # Exact match including repetition
-                                    test_detail["flagged"] = result.flagged
-                                    test_detail["notes"] = result.notes
-                                    break
-                            # If neither has repetition data, it's a simple match
-                            elif repetition_run is None and result.repetition_run is None:
-                                # Simple match without repetitions
-                                test_detail["flagged"] = result.flagged
-                                test_detail["notes"] = result.notes
-                                break
-                            # If only one has repetition data, use positional matching as fallback
-                            elif repetition_run is None and result.repetition_run is not None:
-                                # JSON entry has no repetition info, but result does
-                                # Match by position in the list (old format compatibility)
-                                if i < len(self.test_results) and self.test_results[i] == result:
-                                    test_detail["flagged"] = result.flagged
-                                    test_detail["notes"] = result.notes
-                                    break
-                            elif repetition_run is not None and result.repetition_run is None:
-                                # JSON has repetition info, but result doesn't (shouldn't happen)
-                                # Fall back to simple test_id matching
-                                test_detail["flagged"] = result.flagged
-                                test_detail["notes"] = result.notes
-                                break
-
-            # Write back to file
-            with open(self.results_file, "w") as f:
-                json.dump(self.results_data, f, indent=2)
+                    result = index.get((test_id, repetition_run))
+                    if (
+                        result is None
+                        and repetition_run is None
+                        # JSON entry has no repetition info, but results do -
+                        # match by position (old format compatibility)
+                        and i < len(self.test_results)
+                        and self.test_results[i].test_id == test_id
+                    ):
+                        result = self.test_results[i]
+                    if result is None:
+                        # Mismatched repetition metadata (shouldn't happen) -
+                        # fall back to simple test_id matching
+                        result = by_test_id.get(test_id)
+
+                    if result is not None:
+                        test_detail["flagged"] = result.flagged
+                        test_detail["notes"] = result.notes
+
+            # Write to a temp file and rename into place so a crash
+            # mid-write can't truncate the results file
+            tmp_file = f"{self.results_file}.tmp"
+            try:
+                with open(tmp_file, "wb") as f:
+                    f.write(_json_dump_bytes(self.results_data))
+                os.replace(tmp_file, self.results_file)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_file)
+                raise
 
         except Exception as e:
             if self.console:
@@ -265,16 +487,23 @@ class CLIEvaluator:
 
     def _strip_rich_markup(self, text: str) -> str:
         """Strip Rich markup for plain text display"""
-        import re
-
-        return re.sub(r"\[/?[^]]*\]", "", text)
+        return _strip_markup(text)
 
     def _display_test_result(self, result: TestResult) -> None:
         """Display current test result"""
         if self.console:
             self.console.clear()
+
+            cached_group = self._render_cache.get(self.current_index)
+            if cached_group is not None:
+                self.console.print(cached_group)
+                return
+
             title = f"GPT-OSS-20B Red Team Result Evaluator [{self.current_index + 1}/{len(self.test_results)}]"
-            self.console.print(Panel(title, style="bold blue"))
+
+            # Collect all renderables and print once - each console.print
+            # runs Rich's full render pipeline, so one call per screen
+            renderables: list[Any] = [Panel(title, style="bold blue")]
 
             # Create rich display
             table = Table(show_header=False, header_style="bold magenta")
@@ -298,51 +527,56 @@ class CLIEvaluator:
                 else f"🟢 NO ({result.confidence:.2f})",
             )
 
-            self.console.print(table)
-            self.console.print()
+            renderables.append(table)
+            renderables.append("")
 
             # Display conversation content - always full, no truncation
             if result.conversation_turns and result.all_responses:
                 num_turns = len(result.conversation_turns)
                 conv_title = f"Multi-Turn Conversation ({num_turns} turns)"
                 conversation_text = result.get_display_conversation()
-                self.console.print(Panel(conversation_text, title=conv_title, style="yellow"))
+                renderables.append(Panel(conversation_text, title=conv_title, style="yellow"))
 
             elif result.conversation_turns:
                 # Fallback for older data without individual responses
                 prompt_title = "Multi-Turn Prompts"
                 prompt_text = f"[bold cyan]{result.get_display_prompt()}[/bold cyan]"
-                self.console.print(Panel(prompt_text, title=prompt_title, style="yellow"))
+                renderables.append(Panel(prompt_text, title=prompt_title, style="yellow"))
 
                 # Response with standardized color
                 formatted_response = f"[bold green]{result.response}[/bold green]"
-                self.console.print(Panel(formatted_response, title="Final Response", style="blue"))
+                renderables.append(Panel(formatted_response, title="Final Response", style="blue"))
 
             else:
                 # Single-turn display with standardized colors
                 prompt_text = f"[bold cyan]{result.prompt}[/bold cyan]"
-                self.console.print(Panel(prompt_text, title="Prompt", style="yellow"))
+                renderables.append(Panel(prompt_text, title="Prompt", style="yellow"))
 
                 # Response - always show full response
                 formatted_response = f"[bold green]{result.response}[/bold green]"
-                self.console.print(Panel(formatted_response, title="Response", style="blue"))
+                renderables.append(Panel(formatted_response, title="Response", style="blue"))
 
             # Display evidence if any
             if result.evidence:
-                evidence_text = "\n".join(f"• {e}" for e in result.evidence)
-                self.console.print(Panel(evidence_text, title="Evidence", style="red"))
+                evidence_text = "\n".join([f"• {e}" for e in result.evidence])
+                renderables.append(Panel(evidence_text, title="Evidence", style="red"))
 
             # Display reasoning
             if result.reasoning:
-                self.console.print(Panel(result.reasoning, title="Reasoning", style="blue"))
+                renderables.append(Panel(result.reasoning, title="Reasoning", style="blue"))
+
+            group = Group(*renderables)
+            self._render_cache[self.current_index] = group
+            self.console.print(group)
 
         else:
-            # Fallback text display - always show full content
-            print("=" * 70)
-            print(
-                f"GPT-OSS-20B Red Team Result Evaluator [{self.current_index + 1}/{len(self.test_results)}]"
-            )
-            print("=" * 70)
+            # Fallback text display - always show full content, assembled
+            # into one buffer so the screen updates with a single write
+            lines = [
+                "=" * 70,
+                f"GPT-OSS-20B Red Team Result Evaluator [{self.current_index + 1}/{len(self.test_results)}]",
+                "=" * 70,
+            ]
 
             # Show test ID with repetition info if available
             test_id_display = result.test_id
@@ -351,127 +585,132 @@ class CLIEvaluator:
                     f"{result.test_id} (run {result.repetition_run}/{result.total_repetitions})"
                 )
 
-            print(f"\nTest: {result.test_name} ({test_id_display})")
-            print(f"Category: {result.category}")
-            print(f"Vulnerable: {'YES' if result.vulnerability_detected else 'NO'}")
-            print(f"Confidence: {result.confidence:.2f}")
+            lines.append(f"\nTest: {result.test_name} ({test_id_display})")
+            lines.append(f"Category: {result.category}")
+            lines.append(f"Vulnerable: {'YES' if result.vulnerability_detected else 'NO'}")
+            lines.append(f"Confidence: {result.confidence:.2f}")
 
             if result.conversation_turns and result.all_responses:
                 num_turns = len(result.conversation_turns)
-                print(f"\nFull Conversation ({num_turns} turns):")
-                conversation_text = result._strip_rich_markup(result.get_display_conversation())
-                print(conversation_text)
+                lines.append(f"\nFull Conversation ({num_turns} turns):")
+                lines.append(result.get_display_conversation(plain=True))
             else:
-                print(f"\nPrompt:\n{result._strip_rich_markup(result.get_display_prompt())}")
-                print(f"\nResponse:\n{result.response}")
+                lines.append(f"\nPrompt:\n{result._strip_rich_markup(result.get_display_prompt())}")
+                lines.append(f"\nResponse:\n{result.response}")
 
             if result.evidence:
-                print("\nEvidence:")
-                for e in result.evidence:
-                    print(f"  • {e}")
+                lines.append("\nEvidence:")
+                lines.extend(f"  • {e}" for e in result.evidence)
 
             if result.reasoning:
-                print(f"\nReasoning: {result.reasoning}")
+                lines.append(f"\nReasoning: {result.reasoning}")
+
+            print("\n".join(lines))
+
+    def _build_help_renderable(self) -> Any:
+        """Build the static help screen (table + evaluation note) once"""
+        help_table = Table(title="📖 Command Help", show_header=True, header_style="bold cyan")
+        help_table.add_column("Key", style="yellow", width=8)
+        help_table.add_column("Command", width=25)
+        help_table.add_column("Description", style="dim")
+
+        help_table.add_row("n", "Next result", "Move to the next test result")
+        help_table.add_row("→", "Next result", "Alternative key for next")
+        help_table.add_row("p", "Previous result", "Move to the previous test result")
+        help_table.add_row("←", "Previous result", "Alternative key for previous")
+        help_table.add_row("f", "Flag finding", "Flag as potential finding & auto-save")
+        help_table.add_row("u", "Unflag", "Remove flag from current result")
+        help_table.add_row("j", "Jump to #", "Jump directly to a specific result number")
+        help_table.add_row("c", "Copy prompt", "Copy raw prompts to clipboard for manual testing")
+        help_table.add_row("r", "Copy response", "Copy model response to clipboard for analysis")
+        help_table.add_row("t", "Show thinking", "Display model's chain of thought reasoning")
+        help_table.add_row("e", "Export findings", "Export all flagged results as findings")
+        help_table.add_row("v", "View findings", "Browse findings folder and view files")
+        help_table.add_row("h/?", "Help", "Show this help screen")
+        help_table.add_row("q/end", "Quit", "Exit the evaluator")
+
+        note_panel = Panel(
+            "[bold]Note:[/bold] Judges will handle final scoring and evaluation.\n"
+            "Use this interface to review results and flag promising findings.",
+            title="💡 Evaluation Process",
+            title_align="left",
+        )
+        return Group(help_table, "", note_panel)
 
     def _show_help(self) -> None:
         """Display detailed help for all commands"""
         if self.console:
-            from rich.table import Table
-
-            self.console.print()
-            help_table = Table(title="📖 Command Help", show_header=True, header_style="bold cyan")
-            help_table.add_column("Key", style="yellow", width=8)
-            help_table.add_column("Command", width=25)
-            help_table.add_column("Description", style="dim")
-
-            help_table.add_row("n", "Next result", "Move to the next test result")
-            help_table.add_row("→", "Next result", "Alternative key for next")
-            help_table.add_row("p", "Previous result", "Move to the previous test result")
-            help_table.add_row("←", "Previous result", "Alternative key for previous")
-            help_table.add_row("f", "Flag finding", "Flag as potential finding & auto-save")
-            help_table.add_row("u", "Unflag", "Remove flag from current result")
-            help_table.add_row("j", "Jump to #", "Jump directly to a specific result number")
-            help_table.add_row(
-                "c", "Copy prompt", "Copy raw prompts to clipboard for manual testing"
-            )
-            help_table.add_row(
-                "r", "Copy response", "Copy model response to clipboard for analysis"
-            )
-            help_table.add_row("t", "Show thinking", "Display model's chain of thought reasoning")
-            help_table.add_row("e", "Export findings", "Export all flagged results as findings")
-            help_table.add_row("v", "View findings", "Browse findings folder and view files")
-            help_table.add_row("h/?", "Help", "Show this help screen")
-            help_table.add_row("q/end", "Quit", "Exit the evaluator")
+            if self._help_renderable is None:
+                self._help_renderable = self._build_help_renderable()
 
-            self.console.print(help_table)
             self.console.print()
-
-            # Show evaluation note
-            self.console.print(
-                Panel(
-                    "[bold]Note:[/bold] Judges will handle final scoring and evaluation.\n"
-                    "Use this interface to review results and flag promising findings.",
-                    title="💡 Evaluation Process",
-                    title_align="left",
-                )
-            )
+            self.console.print(self._help_renderable)
 
             input("Press Enter to continue...")
         else:
-            print("\n" + "=" * 60)
-            print("📖 COMMAND HELP")
-            print("=" * 60)
-            print("Navigation:")
-            print("  n/→   - Next result")
-            print("  p/←   - Previous result")
-            print("  j     - Jump to result number")
-            print()
-            print("Actions:")
-            print("  f     - Flag as finding (auto-saves)")
-            print("  u     - Unflag result")
-            print("  c     - Copy prompt to clipboard")
-            print("  r     - Copy response to clipboard")
-            print("  t     - Show chain of thought")
-            print("  e     - Export all flagged findings")
-            print("  v     - View findings folder")
-            print()
-            print("Help & Exit:")
-            print("  h/?   - Show this help")
-            print("  q/end - Quit evaluator")
-            print()
-            print("Note: Judges will handle final scoring and evaluation.")
-            print("Use this interface to review results and flag promising findings.")
-            print("=" * 60)
+            # Static text - emit the whole help screen in one write
+            ruler = "=" * 60
+            print(
+                f"\n{ruler}\n"
+                "📖 COMMAND HELP\n"
+                f"{ruler}\n"
+                "Navigation:\n"
+                "  n/→   - Next result\n"
+                "  p/←   - Previous result\n"
+                "  j     - Jump to result number\n"
+                "\n"
+                "Actions:\n"
+                "  f     - Flag as finding (auto-saves)\n"
+                "  u     - Unflag result\n"
+                "  c     - Copy prompt to clipboard\n"
+                "  r     - Copy response to clipboard\n"
+                "  t     - Show chain of thought\n"
+                "  e     - Export all flagged findings\n"
+                "  v     - View findings folder\n"
+                "\n"
+                "Help & Exit:\n"
+                "  h/?   - Show this help\n"
+                "  q/end - Quit evaluator\n"
+                "\n"
+                "Note: Judges will handle final scoring and evaluation.\n"
+                "Use this interface to review results and flag promising findings.\n"
+                f"{ruler}"
+            )
             input("Press Enter to continue...")
 
     def _get_single_char(self, prompt_text: str = "Command: ") -> str:
         """Get a single character input without pressing Enter"""
+        if not TERMIOS_AVAILABLE:
+            return self._read_command_line(prompt_text)
+
         try:
             if self.console:
                 self.console.print(f"[dim]{prompt_text}[/dim]", end="")
             else:
                 print(f"{prompt_text}", end="", flush=True)
 
-            # Save terminal settings
-            fd = sys.stdin.fileno()
+            # Save terminal settings (fd cached in __init__)
+            fd = self._stdin_fd
+            if fd is None:
+                raise OSError("stdin is not a tty")
             old_settings = termios.tcgetattr(fd)
 
             try:
                 # Set terminal to raw mode
-                tty.setraw(sys.stdin.fileno())
-                char = sys.stdin.read(1)
-
-                # Handle special keys
-                if ord(char) == 27:  # ESC sequence
-                    char += sys.stdin.read(2)
-                    if char == "\x1b[C":  # Right arrow
-                        char = "→"
-                    elif char == "\x1b[D":  # Left arrow
-                        char = "←"
-                    elif char == "\x1b[A":  # Up arrow
-                        char = "↑"
-                    elif char == "\x1b[B":  # Down arrow
-                        char = "↓"
+                tty.setraw(fd)
+
+                # Read at the fd level: sys.stdin.read would pull the whole
+                # escape sequence into the TextIOWrapper buffer, hiding the
+                # pending bytes from select() below
+                data = os.read(fd, 1)
+
+                # Handle special keys; only read the sequence tail when
+                # bytes are actually pending so a bare ESC press doesn't
+                # block the loop
+                if data == b"\x1b" and select.select([fd], [], [], 0.01)[0]:
+                    data += os.read(fd, 2)
+                char = data.decode("utf-8", errors="replace")
+                char = _ESC_MAP.get(char, char)
 
                 # Show the pressed key
                 if self.console:
@@ -490,15 +729,20 @@ class CLIEvaluator:
                 termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
         except (termios.error, OSError, KeyboardInterrupt):
-            # Fallback to regular input if terminal manipulation fails
-            if self.console:
-                return Prompt.ask(f"\n{prompt_text}").lower()
-            else:
-                return input(f"\n{prompt_text}").lower()
+            return self._read_command_line(prompt_text)
+
+    def _read_command_line(self, prompt_text: str) -> str:
+        """Line-based input fallback when raw keystroke reads aren't possible"""
+        if self.console:
+            from rich.prompt import Prompt
+
+            return Prompt.ask(f"\n{prompt_text}").lower()
+        else:
+            return input(f"\n{prompt_text}").lower()
 
     def _display_status_bar(self) -> None:
         """Display status bar with progress and flagged count"""
-        flagged_count = sum(1 for r in self.test_results if r.flagged)
+        flagged_count = self._flagged_count
         progress_text = f"Progress: [{self.current_index + 1}/{len(self.test_results)}]"
         flagged_text = f"Flagged: {flagged_count}"
         commands_text = "Commands: n/p/f/u/j/c/t/e/v/h/?/q/end"
@@ -508,30 +752,33 @@ class CLIEvaluator:
         if self.console:
             self.console.print(Panel(status_line, style="dim", title="Status", title_align="left"))
         else:
-            print(f"\n{'-' * min(len(status_line), 80)}")
-            print(status_line[:80] if len(status_line) > 80 else status_line)
-            print(f"{'-' * min(len(status_line), 80)}")
+            width = self._term_width
+            ruler = "-" * min(len(status_line), width)
+            display_line = status_line[:width] if len(status_line) > width else status_line
+            print(f"\n{ruler}\n{display_line}\n{ruler}")
 
     def _display_commands(self) -> None:
         """Display available commands"""
         if self.console:
-            commands = Table(show_header=True, header_style="bold cyan")
-            commands.add_column("Key", style="yellow")
-            commands.add_column("Command")
-
-            commands.add_row("n/→", "Next result")
-            commands.add_row("p/←", "Previous result")
-            commands.add_row("f", "Flag as potential finding")
-            commands.add_row("u", "Unflag result")
-            commands.add_row("j", "Jump to result number")
-            commands.add_row("c", "Copy prompt to clipboard")
-            commands.add_row("r", "Copy response to clipboard")
-            commands.add_row("t", "Show chain of thought")
-            commands.add_row("e", "Export flagged findings")
-            commands.add_row("v", "View findings folder")
-            commands.add_row("q/end", "Quit")
-
-            self.console.print(commands)
+            if self._commands_table is None:
+                commands = Table(show_header=True, header_style="bold cyan")
+                commands.add_column("Key", style="yellow")
+                commands.add_column("Command")
+
+                commands.add_row("n/→", "Next result")
+                commands.add_row("p/←", "Previous result")
+                commands.add_row("f", "Flag as potential finding")
+                commands.add_row("u", "Unflag result")
+                commands.add_row("j", "Jump to result number")
+                commands.add_row("c", "Copy prompt to clipboard")
+                commands.add_row("r", "Copy response to clipboard")
+                commands.add_row("t", "Show chain of thought")
+                commands.add_row("e", "Export flagged findings")
+                commands.add_row("v", "View findings folder")
+                commands.add_row("q/end", "Quit")
+                self._commands_table = commands
+
+            self.console.print(self._commands_table)
         else:
             print("\nCommands:")
             print("  n/→  - Next result        p/←  - Previous result")
@@ -577,58 +824,62 @@ class CLIEvaluator:
         if self.console:
             self.console.clear()
             title = f"Chain of Thought - {result.test_name} ({result.test_id})"
-            self.console.print(Panel(title, style="bold magenta"))
+
+            # Collect the whole screen and print it once, as in
+            # _display_test_result
+            renderables: list[Any] = [Panel(title, style="bold magenta")]
 
             if result.all_thinking and len(result.all_thinking) > 1:
                 # Multi-turn thinking
                 for i, thinking in enumerate(result.all_thinking, 1):
                     if thinking:
                         turn_title = f"Turn {i} Reasoning"
-                        self.console.print(
+                        renderables.append(
                             Panel(thinking, title=turn_title, style="cyan", border_style="dim")
                         )
                     else:
-                        self.console.print(f"[dim]Turn {i}: No thinking data[/dim]")
-                    self.console.print()
+                        renderables.append(f"[dim]Turn {i}: No thinking data[/dim]")
+                    renderables.append("")
             else:
                 # Single-turn thinking
                 thinking_content = result.thinking or (
                     result.all_thinking[0] if result.all_thinking else ""
                 )
                 if thinking_content:
-                    self.console.print(
+                    renderables.append(
                         Panel(thinking_content, title="Model Reasoning", style="cyan")
                     )
                 else:
-                    self.console.print("[dim]No thinking content available[/dim]")
+                    renderables.append("[dim]No thinking content available[/dim]")
+
+            self.console.print(Group(*renderables))
         else:
-            # Fallback text display
-            print("=" * 70)
-            print(f"Chain of Thought - {result.test_name} ({result.test_id})")
-            print("=" * 70)
+            # Fallback text display - collect lines and print once
+            lines = [
+                "=" * 70,
+                f"Chain of Thought - {result.test_name} ({result.test_id})",
+                "=" * 70,
+            ]
 
             if result.all_thinking and len(result.all_thinking) > 1:
                 # Multi-turn thinking
                 for i, thinking in enumerate(result.all_thinking, 1):
-                    print(f"\nTurn {i} Reasoning:")
-                    print("-" * 40)
-                    if thinking:
-                        print(thinking)
-                    else:
-                        print("No thinking data for this turn")
+                    lines.append(f"\nTurn {i} Reasoning:")
+                    lines.append("-" * 40)
+                    lines.append(thinking if thinking else "No thinking data for this turn")
             else:
                 # Single-turn thinking
                 thinking_content = result.thinking or (
                     result.all_thinking[0] if result.all_thinking else ""
                 )
-                print("\nModel Reasoning:")
-                print("-" * 40)
-                if thinking_content:
-                    print(thinking_content)
-                else:
-                    print("No thinking content available")
+                lines.append("\nModel Reasoning:")
+                lines.append("-" * 40)
+                lines.append(
+                    thinking_content if thinking_content else "No thinking content available"
+                )
 
-            print("=" * 70)
+            lines.append("=" * 70)
+            print("\n".join(lines))
 
         # Wait for user input to return to main view
         if self.console:
@@ -639,45 +890,27 @@ class CLIEvaluator:
         with contextlib.suppress(EOFError, KeyboardInterrupt):
             input()
 
+    def _copy_text_to_clipboard(self, text: str) -> str:
+        """Send text to the pre-detected clipboard command; returns its name"""
+        import subprocess
+
+        if self._clipboard_cmd is None:
+            raise FileNotFoundError("No clipboard command available")
+
+        # Encode once and hand bytes to the pipe - text mode would route
+        # large prompts through an incremental encoder for no benefit
+        subprocess.run(self._clipboard_cmd, input=text.encode("utf-8"), check=True)
+        return self._clipboard_cmd[0]
+
     def _copy_prompt_to_clipboard(self) -> None:
         """Copy current test's raw prompts to clipboard"""
-        import platform
         import subprocess
 
         result = self.test_results[self.current_index]
         raw_prompts = result.get_raw_prompts()
 
         try:
-            # Detect platform and use appropriate clipboard command
-            system = platform.system()
-
-            if system == "Darwin":  # macOS
-                process = subprocess.Popen(["pbcopy"], stdin=subprocess.PIPE, text=True)
-                process.communicate(input=raw_prompts)
-                clipboard_cmd = "pbcopy"
-            elif system == "Linux":
-                # Try xclip first, then xsel
-                try:
-                    process = subprocess.Popen(
-                        ["xclip", "-selection", "clipboard"], stdin=subprocess.PIPE, text=True
-                    )
-                    process.communicate(input=raw_prompts)
-                    clipboard_cmd = "xclip"
-                except FileNotFoundError:
-                    try:
-                        process = subprocess.Popen(
-                            ["xsel", "--clipboard", "--input"], stdin=subprocess.PIPE, text=True
-                        )
-                        process.communicate(input=raw_prompts)
-                        clipboard_cmd = "xsel"
-                    except FileNotFoundError:
-                        raise FileNotFoundError("Neither xclip nor xsel available") from None
-            elif system == "Windows":
-                process = subprocess.Popen(["clip"], stdin=subprocess.PIPE, text=True)
-                process.communicate(input=raw_prompts)
-                clipboard_cmd = "clip"
-            else:
-                raise OSError(f"Unsupported platform: {system}")
+            clipboard_cmd = self._copy_text_to_clipboard(raw_prompts)
 
             # Success message
             if self.console:
@@ -732,7 +965,6 @@ class CLIEvaluator:
 
     def _copy_response_to_clipboard(self) -> None:
         """Copy current test's response to clipboard"""
-        import platform
         import subprocess
 
         result = self.test_results[self.current_index]
@@ -755,36 +987,7 @@ class CLIEvaluator:
             return
 
         try:
-            # Detect platform and use appropriate clipboard command
-            system = platform.system()
-
-            if system == "Darwin":  # macOS
-                process = subprocess.Popen(["pbcopy"], stdin=subprocess.PIPE, text=True)
-                process.communicate(input=response_text)
-                clipboard_cmd = "pbcopy"
-            elif system == "Linux":
-                # Try xclip first, then xsel
-                try:
-                    process = subprocess.Popen(
-                        ["xclip", "-selection", "clipboard"], stdin=subprocess.PIPE, text=True
-                    )
-                    process.communicate(input=response_text)
-                    clipboard_cmd = "xclip"
-                except FileNotFoundError:
-                    try:
-                        process = subprocess.Popen(
-                            ["xsel", "--clipboard", "--input"], stdin=subprocess.PIPE, text=True
-                        )
-                        process.communicate(input=response_text)
-                        clipboard_cmd = "xsel"
-                    except FileNotFoundError:
-                        raise FileNotFoundError("Neither xclip nor xsel available") from None
-            elif system == "Windows":
-                process = subprocess.Popen(["clip"], stdin=subprocess.PIPE, text=True)
-                process.communicate(input=response_text)
-                clipboard_cmd = "clip"
-            else:
-                raise OSError(f"Unsupported platform: {system}")
+            clipboard_cmd = self._copy_text_to_clipboard(response_text)
 
             # Success message
             if self.console:
@@ -835,11 +1038,6 @@ class CLIEvaluator:
             print("No flagged results to export.")
             return
 
-        import json
-        from collections import Counter
-        from datetime import datetime
-        from pathlib import Path
-
         findings_dir = Path("findings")
         findings_dir.mkdir(exist_ok=True)
 
@@ -905,21 +1103,22 @@ class CLIEvaluator:
             "findings": findings_data,
         }
 
-        # Save grouped export
+        # Save grouped export - serialize in memory (orjson when available)
+        # and write once instead of json.dump's stream of small chunk writes
         export_filepath = findings_dir / f"{export_id}.json"
-        with open(export_filepath, "w") as f:
-            json.dump(grouped_export, f, indent=2)
-
-        print(f"✓ Created grouped export: {export_filepath.name}")
-        print(f"   Contains {len(findings_data)} findings")
-        print(f"   Categories: {', '.join(top_categories)}")
-        print(f"   Vulnerable findings: {vulnerable_count}")
-
-        print("\n📁 Export Summary:")
-        print(f"   Created: {export_filepath.name}")
-        print(f"   Contains {len(findings_data)} grouped findings")
-        print("   Saved to findings/ directory")
-        print("   💡 Use 'v' command to browse and 'e' to export individual competition files")
+        export_filepath.write_bytes(_json_dump_bytes(grouped_export))
+
+        print(
+            f"✓ Created grouped export: {export_filepath.name}\n"
+            f"   Contains {len(findings_data)} findings\n"
+            f"   Categories: {', '.join(top_categories)}\n"
+            f"   Vulnerable findings: {vulnerable_count}\n"
+            "\n📁 Export Summary:\n"
+            f"   Created: {export_filepath.name}\n"
+            f"   Contains {len(findings_data)} grouped findings\n"
+            "   Saved to findings/ directory\n"
+            "   💡 Use 'v' command to browse and 'e' to export individual competition files"
+        )
 
         # Wait for user input to return to main view
         if self.console:
@@ -937,6 +1136,81 @@ class CLIEvaluator:
         browser = FindingsBrowser()
         browser.view_findings()
 
+    def _echo(self, message: str) -> None:
+        """Print a status message, rendering markup only when rich is available
+
+        Picking the output path in one place keeps the command handlers free
+        of repeated `if self.console` forks for plain status lines.
+        """
+        if self.console:
+            self.console.print(message)
+        else:
+            print(_strip_markup(message))
+
+    def _cmd_next(self) -> bool:
+        """Advance to the next result; returns False when the session completes"""
+        if self.current_index >= len(self.test_results) - 1:
+            # At the last result, pressing 'n' completes the session
+            flagged_count = self._flagged_count
+
+            self._echo("\n[bold green]🎉 Review Complete![/bold green]")
+            self._echo(f"[green]You've reviewed all {len(self.test_results)} results.[/green]")
+            self._echo(f"[cyan]📊 Session Summary: {flagged_count} flagged for judge review[/cyan]")
+            if flagged_count > 0:
+                self._echo("[yellow]💾 Flagged items have been auto-saved as findings.[/yellow]")
+            return False
+        self.current_index += 1
+        return True
+
+    def _cmd_prev(self) -> bool:
+        """Move to the previous result"""
+        self.current_index = max(self.current_index - 1, 0)
+        return True
+
+    def _cmd_flag(self) -> bool:
+        """Flag the current result and persist the change"""
+        result = self.test_results[self.current_index]
+        if not result.flagged:
+            self._flagged_count += 1
+        result.flagged = True
+        self._echo("🚩 Flagged as potential finding")
+
+        # Save updated results to JSON
+        self._save_updated_results()
+
+        self._echo("[green]✅ Flagged status saved to results file[/green]")
+        self._echo("[dim]💡 Use 'e' in bulk export or 'v' → 'e' to create competition files[/dim]")
+        return True
+
+    def _cmd_unflag(self) -> bool:
+        """Unflag the current result and persist the change"""
+        result = self.test_results[self.current_index]
+        if result.flagged:
+            self._flagged_count -= 1
+        result.flagged = False
+        self._echo("🔄 Unflagged - status updated in results file")
+
+        # Save updated results to JSON
+        self._save_updated_results()
+        return True
+
+    def _cmd_jump(self) -> bool:
+        """Jump to a result number entered by the user"""
+        try:
+            if self.console:
+                from rich.prompt import IntPrompt
+
+                self.console.print("\n[yellow]Jump to result number (1-based):[/yellow]")
+                target = IntPrompt.ask("Target")
+            else:
+                print("\nJump to result number (1-based):")
+                target = int(input("Target: "))
+            self.current_index = max(0, min(target - 1, len(self.test_results) - 1))
+            self._echo(f"[green]Jumped to result {target}[/green]")
+        except (ValueError, EOFError, KeyboardInterrupt):
+            self._echo("[red]Jump cancelled[/red]")
+        return True
+
     def run(self) -> None:
         """Main evaluation loop"""
         try:
@@ -946,109 +1220,25 @@ class CLIEvaluator:
 
                 if result.flagged:
                     if self.console:
-                        self.console.print("[red]🚩 FLAGGED AS FINDING[/red]")
+                        self.console.print(_FLAGGED_BANNER_RICH)
                     else:
-                        print("🚩 FLAGGED AS FINDING")
+                        print(_FLAGGED_BANNER)
 
                 self._display_status_bar()
 
                 # Get user input (single character)
                 command = self._get_single_char()
-                if self.console:
-                    self.console.print()
-                else:
-                    print()
-
-                # Process commands
-                if command in ["n", "next", "→"]:
-                    if self.current_index >= len(self.test_results) - 1:
-                        # At the last result, pressing 'n' completes the session
-                        flagged_count = sum(1 for r in self.test_results if r.flagged)
-
-                        if self.console:
-                            self.console.print()
-                            self.console.print("[bold green]🎉 Review Complete![/bold green]")
-                            self.console.print(
-                                f"[green]You've reviewed all {len(self.test_results)} results.[/green]"
-                            )
-                            self.console.print(
-                                f"[cyan]📊 Session Summary: {flagged_count} flagged for judge review[/cyan]"
-                            )
-                            if flagged_count > 0:
-                                self.console.print(
-                                    "[yellow]💾 Flagged items have been auto-saved as findings.[/yellow]"
-                                )
-                        else:
-                            print("\n🎉 Review Complete!")
-                            print(f"You've reviewed all {len(self.test_results)} results.")
-                            print(f"📊 Session Summary: {flagged_count} flagged for judge review")
-                            if flagged_count > 0:
-                                print("💾 Flagged items have been auto-saved as findings.")
+                # Plain newline either way - no need to route a blank
+                # separator through the rich rendering pipeline
+                print()
+
+                # Process commands - O(1) dict dispatch instead of an
+                # elif chain of string comparisons per keystroke
+                handler = self._command_handlers.get(command)
+                if handler is not None:
+                    if handler() is False:
                         break
-                    else:
-                        self.current_index += 1
-                elif command in ["p", "prev", "←"]:
-                    self.current_index = max(self.current_index - 1, 0)
-                elif command == "f":
-                    result.flagged = True
-                    if self.console:
-                        self.console.print("🚩 Flagged as potential finding")
-                    else:
-                        print("🚩 Flagged as potential finding")
-
-                    # Save updated results to JSON
-                    self._save_updated_results()
-
-                    if self.console:
-                        self.console.print("[green]✅ Flagged status saved to results file[/green]")
-                        self.console.print(
-                            "[dim]💡 Use 'e' in bulk export or 'v' → 'e' to create competition files[/dim]"
-                        )
-                    else:
-                        print("✅ Flagged status saved to results file")
-                        print("💡 Use 'e' in bulk export or 'v' → 'e' to create competition files")
-                elif command == "u":
-                    result.flagged = False
-                    if self.console:
-                        self.console.print("🔄 Unflagged - status updated in results file")
-                    else:
-                        print("🔄 Unflagged - status updated in results file")
-
-                    # Save updated results to JSON
-                    self._save_updated_results()
-                elif command == "j":
-                    try:
-                        if self.console:
-                            self.console.print(
-                                "\n[yellow]Jump to result number (1-based):[/yellow]"
-                            )
-                            target = IntPrompt.ask("Target")
-                        else:
-                            print("\nJump to result number (1-based):")
-                            target = int(input("Target: "))
-                        self.current_index = max(0, min(target - 1, len(self.test_results) - 1))
-                        if self.console:
-                            self.console.print(f"[green]Jumped to result {target}[/green]")
-                        else:
-                            print(f"Jumped to result {target}")
-                    except (ValueError, EOFError, KeyboardInterrupt):
-                        if self.console:
-                            self.console.print("[red]Jump cancelled[/red]")
-                        else:
-                            print("Jump cancelled")
-                elif command == "c":
-                    self._copy_prompt_to_clipboard()
-                elif command == "r":
-                    self._copy_response_to_clipboard()
-                elif command == "t":
-                    self._display_thinking()
-                elif command == "e":
-                    self._export_findings()
-                elif command == "v":
-                    self._view_findings()
-                elif command in ["h", "?"]:
-                    self._show_help()
-                elif command in ["q", "quit", "exit", "end", "\x04"]:
+                elif command in _QUIT_COMMANDS:
                     break
                 else:
                     print(f"Unknown command: {command}")
@@ -1060,7 +1250,7 @@ class CLIEvaluator:
                 print("\nEvaluation interrupted by user")
 
         # Show final summary
-        flagged_count = sum(1 for r in self.test_results if r.flagged)
+        flagged_count = self._flagged_count
 
         if self.console:
             summary = f"Session Summary: {flagged_count} flagged for judge review"
@@ -1071,12 +1261,15 @@ class CLIEvaluator:
 
 def launch_cli_ui(results_file: str) -> None:
     """Launch the CLI UI for result evaluation"""
-    if not Path(results_file).exists():
-        print(f"Error: Results file not found: {results_file}")
-        return
-
     try:
-        evaluator = CLIEvaluator(results_file)
+        # Only a missing results file maps to the not-found message; a
+        # FileNotFoundError raised later in the session (e.g. browsing a
+        # deleted finding) falls through to the generic handler
+        try:
+            evaluator = CLIEvaluator(results_file)
+        except FileNotFoundError:
+            print(f"Error: Results file not found: {results_file}")
+            return
         evaluator.run()
     except Exception as e:
         print(f"Error launching CLI UI: {e}")